@@ -9,48 +9,22 @@ import sys
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-class VideoGenerator:
-    """Main class for generating visual motion videos from text descriptions."""
-    
-    def __init__(self, config_path: str = None):
-        """
-        Initialize the video generator.
-        
-        Args:
-            config_path: Path to the configuration file
-        """
-        self.config = self._load_config(config_path) if config_path else {}
-        
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load configuration from JSON file."""
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: Configuration file not found at {config_path}")
-            return {}
-        except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON in configuration file: {e}")
-            return {}
-    
-    def generate_video_prompt(self, scene_description: str) -> str:
-        """
-        Generate an optimized video prompt from scene description.
-        
-        Args:
-            scene_description: The text description of the scene
-            
-        Returns:
-            Optimized prompt for video generation
-        """
-        # Enhance the prompt with video-specific instructions
-        video_prompt = f"""Generate a cinematic visual motion video with the following specifications:
+
+# Video prompt template, split around the scene description so that
+# generate_video_prompt only needs a plain concatenation per call.
+_PROMPT_PREFIX = """Generate a cinematic visual motion video with the following specifications:
 
 Scene Description:
-{scene_description}
+"""
+
+_PROMPT_SUFFIX = """
 
 Technical Requirements:
 - Resolution: 1920x1080 (Full HD)
@@ -69,81 +43,19 @@ Style:
 - Attention to cultural authenticity
 - Emphasis on details and textures
 """
-        return video_prompt
-    
-    def generate_video(self, prompt: str, output_path: str = "output") -> Dict[str, Any]:
-        """
-        Generate video from text prompt.
-        
-        Args:
-            prompt: The text description for video generation
-            output_path: Directory to save the generated video
-            
-        Returns:
-            Dictionary containing generation results and metadata
-        """
-        print("=" * 80)
-        print("LANA - Visual Motion Video Generator")
-        print("=" * 80)
-        print("\nGenerating video from prompt...")
-        print(f"\nPrompt length: {len(prompt)} characters")
-        print(f"Output directory: {output_path}")
-        
-        # Create output directory if it doesn't exist
-        Path(output_path).mkdir(parents=True, exist_ok=True)
-        
-        # Generate optimized prompt
-        optimized_prompt = self.generate_video_prompt(prompt)
-        
-        # Save the prompt to a file for reference
-        prompt_file = Path(output_path) / "generation_prompt.txt"
-        with open(prompt_file, 'w', encoding='utf-8') as f:
-            f.write(optimized_prompt)
-        
-        print(f"\n✓ Generated prompt saved to: {prompt_file}")
-        
-        # Create a metadata file
-        metadata = {
-            "original_prompt": prompt,
-            "optimized_prompt": optimized_prompt,
-            "output_path": output_path,
-            "status": "ready_for_generation",
-            "technical_specs": {
-                "resolution": "1920x1080",
-                "fps": 30,
-                "duration_seconds": "30-60",
-                "format": "MP4",
-                "codec": "H.264"
-            },
-            "notes": [
-                "This system prepares video generation prompts for AI video generation services",
-                "To generate the actual video, use services like:",
-                "  - OpenAI's Sora (when available)",
-                "  - Runway Gen-2",
-                "  - Stability AI's Stable Video Diffusion",
-                "  - Pika Labs",
-                "  - Other AI video generation platforms"
-            ]
-        }
-        
-        metadata_file = Path(output_path) / "metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, indent=2, fp=f)
-        
-        print(f"✓ Metadata saved to: {metadata_file}")
-        
-        # Create a README with instructions
-        readme_content = """# Video Generation Output
+
+
+# Instructions written alongside the generated prompt and metadata. The file
+# names differ between output layouts, so they are filled in per layout below.
+_README_TEMPLATE = """# Video Generation Output
 
 ## Files Generated
 
-- `generation_prompt.txt`: Optimized prompt for video generation services
-- `metadata.json`: Technical specifications and metadata
-- `README.md`: This file
+{files}
 
 ## Next Steps
 
-To generate the actual video, you can use the prompt in `generation_prompt.txt` with:
+To generate the actual video, you can use the prompt in {prompt_source} with:
 
 ### Option 1: OpenAI Sora (when available)
 ```bash
@@ -155,7 +67,7 @@ To generate the actual video, you can use the prompt in `generation_prompt.txt`
 1. Visit https://runwayml.com/
 2. Sign up for an account
 3. Use the "Gen-2" video generation tool
-4. Paste the prompt from `generation_prompt.txt`
+4. Paste the prompt from {prompt_source}
 5. Adjust duration and settings as needed
 6. Generate and download your video
 
@@ -176,7 +88,7 @@ pip install diffusers transformers accelerate
 
 ## Technical Specifications
 
-See `metadata.json` for complete technical specifications including:
+See {metadata_source} for complete technical specifications including:
 - Resolution: 1920x1080
 - Frame Rate: 30 fps
 - Recommended Duration: 30-60 seconds
@@ -189,62 +101,413 @@ See `metadata.json` for complete technical specifications including:
 3. Adjust technical parameters based on platform capabilities
 4. Review and iterate on the output
 """
+
+_README_CONTENT = _README_TEMPLATE.format(
+    files=(
+        "- `generation_prompt.txt`: Optimized prompt for video generation services\n"
+        "- `metadata.json`: Technical specifications and metadata\n"
+        "- `README.md`: This file"
+    ),
+    prompt_source="`generation_prompt.txt`",
+    metadata_source="`metadata.json`",
+)
+
+_README_BUNDLE_CONTENT = _README_TEMPLATE.format(
+    files=(
+        "- `bundle.json`: A single document holding the optimized prompt under `prompt`,\n"
+        "  technical specifications and metadata under `metadata`, and these\n"
+        "  instructions under `readme`"
+    ),
+    prompt_source="the `prompt` field of `bundle.json`",
+    metadata_source="the `metadata` field of `bundle.json`",
+)
+
+_README_BATCH_CONTENT = _README_TEMPLATE.format(
+    files=(
+        "- `prompt_NNN.txt`: Optimized prompt for video generation services, one per scene\n"
+        "- `metadata_NNN.json`: Technical specifications and metadata, one per scene\n"
+        "- `README.md`: This file"
+    ),
+    prompt_source="the scene's `prompt_NNN.txt`",
+    metadata_source="the scene's `metadata_NNN.json`",
+)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def _metadata_constants() -> Dict[str, Any]:
+    """Return the metadata fields that are the same for every call."""
+    return {
+        "status": "ready_for_generation",
+        "technical_specs": {
+            "resolution": "1920x1080",
+            "fps": 30,
+            "duration_seconds": "30-60",
+            "format": "MP4",
+            "codec": "H.264"
+        },
+        "notes": [
+            "This system prepares video generation prompts for AI video generation services",
+            "To generate the actual video, use services like:",
+            "  - OpenAI's Sora (when available)",
+            "  - Runway Gen-2",
+            "  - Stability AI's Stable Video Diffusion",
+            "  - Pika Labs",
+            "  - Other AI video generation platforms"
+        ]
+    }
+
+
+def _complete_metadata(head: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the per-call metadata fields followed by the constant ones."""
+    metadata = dict(head)
+    metadata.update(_metadata_constants())
+    return metadata
+
+
+# _json_dumps output for a non-empty object always starts with _JSON_OPEN and
+# ends with _JSON_CLOSE (2-space indent plus a trailing newline, for both the
+# orjson and stdlib backends), so encoded members can be spliced together.
+_JSON_OPEN = b"{\n"
+_JSON_CLOSE = b"\n}\n"
+
+# Encoded constant metadata fields, without the opening brace, ready to be
+# appended after the per-call metadata fields.
+_METADATA_TAIL = _json_dumps(_metadata_constants())[len(_JSON_OPEN):]
+
+
+def _metadata_json(head: Dict[str, Any]) -> bytes:
+    """Encode metadata.json from its per-call fields plus the pre-encoded constants."""
+    if not head:
+        return _JSON_OPEN + _METADATA_TAIL
+    return _json_dumps(head)[:-len(_JSON_CLOSE)] + b",\n" + _METADATA_TAIL
+
+
+# Fixed sections of the progress report printed by generate_video.
+_RULE = "=" * 80
+
+_REPORT_HEADER = (
+    f"{_RULE}\n"
+    "LANA - Visual Motion Video Generator\n"
+    f"{_RULE}\n"
+    "\nGenerating video from prompt...\n"
+)
+
+_REPORT_COMPLETE = (
+    f"\n{_RULE}\n"
+    "✓ Video generation preparation complete!\n"
+    f"{_RULE}\n"
+)
+
+# Closing next-steps section of the report, filled in per output layout.
+_REPORT_NEXT_STEPS_TEMPLATE = (
+    "\nNext steps:\n"
+    "1. Review the generated {prompt} {prompt_source}\n"
+    "2. Choose a video generation platform (see {readme_source})\n"
+    "3. Use the {prompt} to generate your cinematic {video}\n"
+    f"\n{_RULE}\n"
+)
+
+_REPORT_NEXT_STEPS = _REPORT_NEXT_STEPS_TEMPLATE.format(
+    prompt="prompt",
+    prompt_source="in generation_prompt.txt",
+    readme_source="README.md",
+    video="video",
+)
+
+_REPORT_NEXT_STEPS_BUNDLE = _REPORT_NEXT_STEPS_TEMPLATE.format(
+    prompt="prompt",
+    prompt_source="under \"prompt\" in bundle.json",
+    readme_source="\"readme\" in bundle.json",
+    video="video",
+)
+
+_REPORT_NEXT_STEPS_BATCH = _REPORT_NEXT_STEPS_TEMPLATE.format(
+    prompt="prompts",
+    prompt_source="in prompt_NNN.txt",
+    readme_source="README.md",
+    video="videos",
+)
+
+
+def _write_report(summary: List[str], output_path: str, next_steps: str) -> None:
+    """Write the progress report to stdout in a single call."""
+    sys.stdout.write("".join((
+        _REPORT_HEADER,
+        *summary,
+        _REPORT_COMPLETE,
+        f"\nOutput files created in: {output_path}/\n",
+        next_steps,
+    )))
+
+
+# Parsed configuration files keyed by (absolute path, mtime, size), so that
+# constructing several generators from the same config only parses it once.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+class VideoGenerator:
+    """Main class for generating visual motion videos from text descriptions."""
+    
+    def __init__(self, config_path: str = None):
+        """
+        Initialize the video generator.
+        
+        Args:
+            config_path: Path to the configuration file
+        """
+        self.config = self._load_config(config_path) if config_path else {}
+        
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """Load configuration from JSON file, reusing the cached parse if unchanged."""
+        try:
+            st = os.stat(config_path)
+            key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+            if key in _CONFIG_CACHE:
+                return _CONFIG_CACHE[key]
+            config = _json_loads(Path(config_path).read_bytes())
+            _CONFIG_CACHE[key] = config
+            return config
+        except FileNotFoundError:
+            print(f"Warning: Configuration file not found at {config_path}")
+            return {}
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON in configuration file: {e}")
+            return {}
+    
+    def generate_video_prompt(self, scene_description: str) -> str:
+        """
+        Generate an optimized video prompt from scene description.
+        
+        Args:
+            scene_description: The text description of the scene
+            
+        Returns:
+            Optimized prompt for video generation
+        """
+        return _PROMPT_PREFIX + scene_description + _PROMPT_SUFFIX
+    
+    def generate_video_prompts(self, scene_descriptions: List[str]) -> List[str]:
+        """
+        Generate optimized video prompts for several scene descriptions.
+        
+        Args:
+            scene_descriptions: The text descriptions of the scenes
+            
+        Returns:
+            Optimized prompts, in the same order as the descriptions
+        """
+        return [_PROMPT_PREFIX + scene + _PROMPT_SUFFIX for scene in scene_descriptions]
+    
+    def generate_video(self, prompt: str, output_path: str = "output",
+                       bundle: bool = False, dry_run: bool = False,
+                       verbose: bool = True) -> Dict[str, Any]:
+        """
+        Generate video from text prompt.
+        
+        Args:
+            prompt: The text description for video generation
+            output_path: Directory to save the generated video
+            bundle: Write a single bundle.json holding the prompt, metadata
+                and instructions instead of three separate files
+            dry_run: Skip all filesystem writes and return the metadata with
+                the optimized prompt embedded under "optimized_prompt"; cannot
+                be combined with bundle
+            verbose: Print a progress report to stdout once the files are written
+            
+        Returns:
+            Dictionary containing generation results and metadata. In dry-run
+            mode it holds "optimized_prompt" (the prompt text) in place of
+            "optimized_prompt_file"
+            
+        Raises:
+            ValueError: If both bundle and dry_run are set
+        """
+        if bundle and dry_run:
+            raise ValueError("bundle cannot be used with dry_run")
         
-        readme_file = Path(output_path) / "README.md"
-        with open(readme_file, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        # Generate optimized prompt
+        optimized_prompt = self.generate_video_prompt(prompt)
+        
+        if dry_run:
+            return _complete_metadata({
+                "original_prompt": prompt,
+                "optimized_prompt": optimized_prompt,
+                "output_path": output_path,
+            })
+        
+        # Create output directory if it doesn't exist
+        os.makedirs(output_path, exist_ok=True)
+        out_dir = Path(output_path)
+        
+        # Create the metadata; in bundle mode the prompt travels alongside it
+        head = {"original_prompt": prompt}
+        if not bundle:
+            head["optimized_prompt_file"] = "generation_prompt.txt"
+        head["output_path"] = output_path
+        metadata = _complete_metadata(head)
         
-        print(f"✓ Instructions saved to: {readme_file}")
-        print("\n" + "=" * 80)
-        print("✓ Video generation preparation complete!")
-        print("=" * 80)
-        print(f"\nOutput files created in: {output_path}/")
-        print("\nNext steps:")
-        print("1. Review the generated prompt in generation_prompt.txt")
-        print("2. Choose a video generation platform (see README.md)")
-        print("3. Use the prompt to generate your cinematic video")
-        print("\n" + "=" * 80)
+        if bundle:
+            # Save everything as one document
+            bundle_file = out_dir / "bundle.json"
+            bundle_file.write_bytes(_json_dumps({
+                "prompt": optimized_prompt,
+                "metadata": metadata,
+                "readme": _README_BUNDLE_CONTENT,
+            }))
+            
+            if verbose:
+                _write_report([
+                    f"\nPrompt length: {len(prompt)} characters\n",
+                    f"Output directory: {output_path}\n",
+                    f"\n✓ Bundle saved to: {bundle_file}\n",
+                ], output_path, _REPORT_NEXT_STEPS_BUNDLE)
+            
+            return metadata
+        
+        # Save the prompt to a file for reference
+        prompt_file = out_dir / "generation_prompt.txt"
+        prompt_file.write_text(optimized_prompt, encoding='utf-8')
+        
+        metadata_file = out_dir / "metadata.json"
+        metadata_file.write_bytes(_metadata_json(head))
+        
+        # Create a README with instructions
+        readme_file = out_dir / "README.md"
+        readme_file.write_text(_README_CONTENT, encoding='utf-8')
+        
+        if verbose:
+            _write_report([
+                f"\nPrompt length: {len(prompt)} characters\n",
+                f"Output directory: {output_path}\n",
+                f"\n✓ Generated prompt saved to: {prompt_file}\n",
+                f"✓ Metadata saved to: {metadata_file}\n",
+                f"✓ Instructions saved to: {readme_file}\n",
+            ], output_path, _REPORT_NEXT_STEPS)
         
         return metadata
+    
+    def generate_videos(self, prompts: List[str], output_path: str = "output",
+                        verbose: bool = True) -> List[Dict[str, Any]]:
+        """
+        Generate video preparation files for several prompts at once.
+        
+        Each prompt gets a numbered prompt_NNN.txt and metadata_NNN.json in
+        the same output directory, alongside a single shared README.md. The
+        numbers are zero-padded to at least three digits, and wider for
+        larger batches, so the files sort in scene order.
+        
+        Args:
+            prompts: The text descriptions for video generation
+            output_path: Directory to save the generated files
+            verbose: Print a summary to stdout once the files are written
+            
+        Returns:
+            List of metadata dictionaries, one per prompt; empty, with nothing
+            written, when prompts is empty
+        """
+        if not prompts:
+            return []
+        
+        os.makedirs(output_path, exist_ok=True)
+        out_dir = Path(output_path)
+        
+        width = max(3, len(str(len(prompts) - 1)))
+        optimized_prompts = self.generate_video_prompts(prompts)
+        
+        results = []
+        for index, (prompt, optimized_prompt) in enumerate(zip(prompts, optimized_prompts)):
+            number = f"{index:0{width}d}"
+            prompt_name = f"prompt_{number}.txt"
+            (out_dir / prompt_name).write_text(optimized_prompt, encoding='utf-8')
+            
+            head = {
+                "original_prompt": prompt,
+                "optimized_prompt_file": prompt_name,
+                "output_path": output_path,
+            }
+            (out_dir / f"metadata_{number}.json").write_bytes(_metadata_json(head))
+            results.append(_complete_metadata(head))
+        
+        (out_dir / "README.md").write_text(_README_BATCH_CONTENT, encoding='utf-8')
+        
+        if verbose:
+            _write_report([
+                f"\nScenes: {len(results)}\n",
+                f"Output directory: {output_path}\n",
+                f"\n✓ Prompts and metadata saved for {len(results)} scenes\n",
+            ], output_path, _REPORT_NEXT_STEPS_BATCH)
+        
+        return results
 
 
-def main():
-    """Main entry point for the video generator."""
-    parser = argparse.ArgumentParser(
-        description='LANA - Generate visual motion videos from text descriptions',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Command line interface, built once at import time.
+_PARSER = argparse.ArgumentParser(
+    description='LANA - Generate visual motion videos from text descriptions',
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    epilog="""
 Examples:
   python generate_video.py --config scenes/kazakh_scene.json
   python generate_video.py --prompt "A beautiful sunset scene" --output ./my_video
   python generate_video.py --config scenes/kazakh_scene.json --output ./kazakh_video
-        """
-    )
-    
-    parser.add_argument(
-        '--config',
-        type=str,
-        help='Path to JSON configuration file with scene description'
-    )
-    
-    parser.add_argument(
-        '--prompt',
-        type=str,
-        help='Direct text prompt for video generation'
-    )
-    
-    parser.add_argument(
-        '--output',
-        type=str,
-        default='output',
-        help='Output directory for generated files (default: output)'
-    )
-    
-    args = parser.parse_args()
+  python generate_video.py --prompt "A beautiful sunset scene" --bundle
+  python generate_video.py --config scenes/kazakh_scene.json --dry-run
+    """
+)
+
+_PARSER.add_argument(
+    '--config',
+    type=str,
+    help='Path to JSON configuration file with scene description'
+)
+
+_PARSER.add_argument(
+    '--prompt',
+    type=str,
+    help='Direct text prompt for video generation'
+)
+
+_PARSER.add_argument(
+    '--output',
+    type=str,
+    default='output',
+    help='Output directory for generated files (default: output)'
+)
+
+_PARSER.add_argument(
+    '--bundle',
+    action='store_true',
+    help='Write a single bundle.json instead of separate prompt, metadata and README files'
+)
+
+_PARSER.add_argument(
+    '--dry-run',
+    action='store_true',
+    help='Print the optimized prompt to stdout without writing any files'
+)
+
+
+def main():
+    """Main entry point for the video generator."""
+    args = _PARSER.parse_args()
     
     # Validate inputs
     if not args.config and not args.prompt:
-        parser.error("Either --config or --prompt must be provided")
+        _PARSER.error("Either --config or --prompt must be provided")
+    if args.bundle and args.dry_run:
+        _PARSER.error("--bundle cannot be used with --dry-run")
     
     # Initialize generator
     generator = VideoGenerator(config_path=args.config)
@@ -259,12 +522,11 @@ Examples:
         prompt = args.prompt
     
     # Generate video preparation files
-    try:
-        result = generator.generate_video(prompt, args.output)
-        sys.exit(0)
-    except Exception as e:
-        print(f"\nError: {e}")
-        sys.exit(1)
+    if args.dry_run:
+        result = generator.generate_video(prompt, args.output, dry_run=True)
+        sys.stdout.write(result["optimized_prompt"])
+    else:
+        generator.generate_video(prompt, args.output, bundle=args.bundle)
 
 
 if __name__ == "__main__":
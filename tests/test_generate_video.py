@@ -0,0 +1,65 @@
+"""Tests for generate_video. Run with: python -m unittest discover -s tests"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import generate_video
+
+
+HEADS = (
+    {},
+    {
+        "original_prompt": "Юрта на рассвете — \"beshbarmak\"\n",
+        "optimized_prompt_file": "generation_prompt.txt",
+        "output_path": "output",
+    },
+)
+
+
+class MetadataJsonTest(unittest.TestCase):
+    """_metadata_json must match a full encode of the same metadata."""
+
+    def assert_splice_matches(self):
+        tail = generate_video._json_dumps(generate_video._metadata_constants())
+        with mock.patch.object(generate_video, "_METADATA_TAIL",
+                               tail[len(generate_video._JSON_OPEN):]):
+            for head in HEADS:
+                with self.subTest(head=head):
+                    spliced = generate_video._metadata_json(head)
+                    full = generate_video._json_dumps(generate_video._complete_metadata(head))
+                    self.assertEqual(spliced, full)
+                    self.assertEqual(json.loads(spliced),
+                                     generate_video._complete_metadata(head))
+
+    @unittest.skipIf(generate_video.orjson is None, "orjson is not installed")
+    def test_orjson_backend(self):
+        self.assert_splice_matches()
+
+    def test_stdlib_backend(self):
+        with mock.patch.object(generate_video, "orjson", None):
+            self.assert_splice_matches()
+
+
+class GenerateVideoTest(unittest.TestCase):
+
+    def test_bundle_with_dry_run_is_rejected(self):
+        with self.assertRaises(ValueError):
+            generate_video.VideoGenerator().generate_video("scene", bundle=True, dry_run=True)
+
+
+class GenerateVideosTest(unittest.TestCase):
+
+    def test_empty_batch_writes_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "batch")
+            results = generate_video.VideoGenerator().generate_videos(
+                [], output_path, verbose=False)
+            self.assertEqual(results, [])
+            self.assertFalse(os.path.exists(output_path))
+
+
+if __name__ == "__main__":
+    unittest.main()